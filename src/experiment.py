@@ -10,7 +10,6 @@ import wandb
 
 from omegaconf import OmegaConf
 from os import path
-from collections import OrderedDict
 from transformers import get_linear_schedule_with_warmup
 from transformers import AutoModel, AutoTokenizer
 
@@ -128,33 +127,28 @@ class Experiment:
                 if path.exists(singleton_file):
                     logger.info(f"Singleton file found: {singleton_file}")
 
+            dataset_dir = path.join(base_data_dir, dataset_name)
+            # Datasets such as litbank have cross validation splits
+            cross_val_split = attributes.get("cross_val_split", None)
+
             # Data directory is a function of dataset name and tokenizer used
-            data_dir = path.join(path.join(base_data_dir, dataset_name), model_name)
+            data_dir = path.join(dataset_dir, model_name)
             # Check if speaker tokens are added
             if add_speaker_tokens:
-                pot_data_dir = path.join(
-                    path.join(path.join(base_data_dir, dataset_name)),
-                    model_name + "_speaker",
-                )
+                pot_data_dir = path.join(dataset_dir, model_name + "_speaker")
                 if path.exists(pot_data_dir):
                     data_dir = pot_data_dir
 
-            # Datasets such as litbank have cross validation splits
-            if attributes.get("cross_val_split", None) is not None:
-                data_dir = path.join(data_dir, str(attributes.get("cross_val_split")))
+            if cross_val_split is not None:
+                data_dir = path.join(data_dir, str(cross_val_split))
 
             logger.info("Data directory: %s" % data_dir)
 
             # CoNLL data dir
             if attributes.get("has_conll", False):
-                conll_dir = path.join(
-                    path.join(path.join(base_data_dir, dataset_name)), "conll"
-                )
-                if attributes.get("cross_val_split", None) is not None:
-                    # LitBank like datasets have cross validation splits
-                    conll_dir = path.join(
-                        conll_dir, str(attributes.get("cross_val_split"))
-                    )
+                conll_dir = path.join(dataset_dir, "conll")
+                if cross_val_split is not None:
+                    conll_dir = path.join(conll_dir, str(cross_val_split))
 
                 if path.exists(conll_dir):
                     self.conll_data_dir[dataset_name] = conll_dir
@@ -584,8 +578,7 @@ class Experiment:
 
             for dataset in self.data_iter_map.get(split, []):
                 dataset_dir = path.join(self.config.paths.model_dir, dataset)
-                if not path.exists(dataset_dir):
-                    os.makedirs(dataset_dir)
+                os.makedirs(dataset_dir, exist_ok=True)
 
                 if dataset not in dataset_output_dict:
                     dataset_output_dict[dataset] = {}
@@ -622,8 +615,7 @@ class Experiment:
         if not self.config.infra.is_local:
             parent_dir = path.dirname(path.normpath(self.config.paths.model_dir))
             perf_dir = path.join(parent_dir, "perf")
-            if not path.exists(perf_dir):
-                os.makedirs(perf_dir)
+            os.makedirs(perf_dir, exist_ok=True)
 
             gold_ment_str = ""
             if self.config.model.mention_params.use_gold_ments:
@@ -744,14 +736,14 @@ class Experiment:
                         If false, don't save optimizers and schedulers which take up a lot of space.
         """
 
-        model_state_dict = OrderedDict(self.model.state_dict())
+        model_state_dict = dict(self.model.state_dict())
         doc_encoder_state_dict = {}
 
         # Separate the doc_encoder state dict
         # We will save the model in two parts:
         # (a) Doc encoder parameters - Useful for final upload to huggingface
         # (b) Rest of the model parameters, optimizers, schedulers, and other bookkeeping variables
-        for key in self.model.state_dict():
+        for key in list(model_state_dict):
             if "lm_encoder." in key:
                 doc_encoder_state_dict[key] = model_state_dict[key]
                 del model_state_dict[key]
@@ -761,8 +753,7 @@ class Experiment:
             doc_encoder_dir = path.join(
                 path.dirname(location), self.config.paths.doc_encoder_dirname
             )
-            if not path.exists(doc_encoder_dir):
-                os.makedirs(doc_encoder_dir)
+            os.makedirs(doc_encoder_dir, exist_ok=True)
 
             logger.info(f"Encoder saved at {path.abspath(doc_encoder_dir)}")
             # Save the encoder
@@ -7,8 +7,6 @@ import hashlib
 import json
 import wandb
 
-from experiment import Experiment
-
 logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.INFO)
 logger = logging.getLogger()
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -49,8 +47,7 @@ def main_train(config):
     config.paths.best_model_dir = path.join(config.paths.model_dir, "best")
 
     for model_dir in [config.paths.model_dir, config.paths.best_model_dir]:
-        if not path.exists(model_dir):
-            os.makedirs(model_dir)
+        os.makedirs(model_dir, exist_ok=True)
 
     if config.paths.model_path is None:
         config.paths.model_path = path.abspath(
@@ -111,6 +108,10 @@ def main(config):
             config.use_wandb = False
 
     logger.info(f"Model name: {model_name}")
+
+    # Deferred so that config errors and --help don't pay for importing torch
+    from experiment import Experiment
+
     Experiment(config)
 
 
@@ -4,7 +4,7 @@ import time
 import json
 import torch
 from os import path
-from collections import OrderedDict, Counter
+from collections import Counter
 
 from coref_utils.metrics import CorefEvaluator
 from coref_utils.conll import evaluate_conll
@@ -54,8 +54,7 @@ def full_coref_evaluation(
     logger.info(f"Dataset: {dataset}, Cluster Threshold: {cluster_threshold}")
 
     log_dir = path.join(config.paths.model_dir, dataset)
-    if not path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     gold_ment_str = ""
     if config.model.mention_params.use_gold_ments:
         gold_ment_str = "_gold"
@@ -132,14 +131,14 @@ def full_coref_evaluation(
 
             f.write(json.dumps(log_example) + "\n")
 
-        result_dict: Dict = OrderedDict()
+        result_dict: Dict = {}
         perf_str: str = ""
         # Print individual metrics
         for indv_metric, indv_evaluator in zip(config.metrics, evaluator.evaluators):
             perf_str += (
                 ", " + indv_metric + ": {:.1f}".format(indv_evaluator.get_f1() * 100)
             )
-            result_dict[indv_metric] = OrderedDict()
+            result_dict[indv_metric] = {}
             result_dict[indv_metric]["recall"] = round(
                 indv_evaluator.get_recall() * 100, 1
             )
@@ -248,8 +247,7 @@ def targeted_coref_evaluation(
 
     # Set up logging paths
     log_dir = path.join(config.paths.model_dir, dataset)
-    if not path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     log_file = path.join(log_dir, split + ".log.jsonl")
 
     with open(log_file, "w") as f: